@@ -1,5 +1,9 @@
+import fnmatch
+import re
+from collections import OrderedDict, namedtuple
+
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QAbstractButton, QDockWidget, QSizePolicy
+from PyQt5.QtWidgets import QAbstractButton, QDockWidget, QSizePolicy, QWidget
 
 from krita import Krita
 
@@ -16,42 +20,182 @@ _TITLE_BAR_MARGINS_PROPERTY = "_super_docker_lock_titlebar_margins"
 _TITLE_BAR_LAYOUT_MARGINS_PROPERTY = "_super_docker_lock_titlebar_layout_margins"
 _TITLE_BAR_LAYOUT_SPACING_PROPERTY = "_super_docker_lock_titlebar_layout_spacing"
 _DOCK_SIZE_CONSTRAINTS_PROPERTY = "_super_docker_lock_dock_size_constraints"
+_MAX_QT_DIMENSION = 16777215  # Maximum value for QWidget dimensions
 _TITLE_BAR_COLLAPSE_STYLE = (
     "min-height:0px; max-height:0px; height:0px; padding:0px; margin:0px;"
 )
+_TITLE_BAR_PLACEHOLDER_NAME = "_super_docker_lock_titlebar_placeholder"
+_TITLE_BAR_PLACEHOLDER_PROPERTY = "_super_docker_lock_titlebar_placeholder"
+
+_SETTINGS_GROUP = "super_docker_lock"
+
+# --- Title Bar Collapse Strategy ---
+
+# "style" rewrites Krita's title bar down to zero height,
+# "placeholder" swaps in an empty zero-height title bar and parks Krita's.
+TITLE_BAR_STRATEGY_STYLE = "style"
+TITLE_BAR_STRATEGY_PLACEHOLDER = "placeholder"
+_TITLE_BAR_STRATEGIES = (TITLE_BAR_STRATEGY_STYLE, TITLE_BAR_STRATEGY_PLACEHOLDER)
+
+_title_bar_strategy = TITLE_BAR_STRATEGY_STYLE
+
+def load_title_bar_strategy():
+    """
+    Reads the title bar collapse strategy from the [super_docker_lock]
+    group of kritarc, where it is edited by hand. Title bars collapsed with
+    the other strategy are still restored correctly after a change.
+    """
+    global _title_bar_strategy
+    raw_value = Krita.instance().readSetting(
+        _SETTINGS_GROUP, "title_bar_strategy", TITLE_BAR_STRATEGY_STYLE
+    )
+    strategy = str(raw_value).strip().lower()
+    if strategy not in _TITLE_BAR_STRATEGIES:
+        strategy = TITLE_BAR_STRATEGY_STYLE
+    _title_bar_strategy = strategy
+    return strategy
+
+class _TitleBarPlaceholder(QWidget):
+    """
+    Zero-height title bar swapped in while Krita's own title bar is parked.
+    """
+
+    def __init__(self, parked_title_bar, parent=None):
+        super().__init__(parent)
+        self.parked_title_bar = parked_title_bar
+        self.setObjectName(_TITLE_BAR_PLACEHOLDER_NAME)
+        self.setFixedHeight(0)
+
+# --- Per-Docker Rules ---
+
+_RULE_EXCLUDE = "exclude"
+_RULE_LOCK_WIDTH = "lock_width"
+_RULE_LOCK_HEIGHT = "lock_height"
+_RULE_KEEP_TITLE_BAR = "keep_title_bar"
+_RULE_SETTINGS = {
+    _RULE_EXCLUDE: "exclude_dockers",
+    _RULE_LOCK_WIDTH: "lock_width_dockers",
+    _RULE_LOCK_HEIGHT: "lock_height_dockers",
+    _RULE_KEEP_TITLE_BAR: "keep_title_bar_dockers",
+}
+
+_docker_rules = {}
+
+def _split_rule_patterns(raw_value):
+    if not raw_value:
+        return []
+    return [part.strip() for part in str(raw_value).split(",") if part.strip()]
+
+def _compile_rule_patterns(patterns):
+    """
+    Split objectName patterns into an exact-name set and a single regex
+    for the ones that use * / ? / [ ] wildcards.
+    """
+    names = set()
+    wildcards = []
+    for pattern in patterns:
+        if any(char in pattern for char in "*?["):
+            wildcards.append(fnmatch.translate(pattern))
+        else:
+            names.add(pattern)
+    regex = re.compile("|".join(wildcards)) if wildcards else None
+    return frozenset(names), regex
+
+def load_docker_rules():
+    """
+    Reads the per-docker rules from Krita's settings and compiles them.
+    Each rule is a comma-separated list of docker objectNames or wildcards
+    in the [super_docker_lock] group of kritarc.
+    """
+    inst = Krita.instance()
+    rules = {
+        rule: _split_rule_patterns(inst.readSetting(_SETTINGS_GROUP, setting, ""))
+        for rule, setting in _RULE_SETTINGS.items()
+    }
+    _set_docker_rules(rules)
+    return rules
+
+def save_docker_rules(rules):
+    """
+    Persists the per-docker rules through Krita's settings and recompiles them.
+    rules maps "exclude", "lock_width", "lock_height" and "keep_title_bar"
+    to lists of docker objectNames or wildcards.
+    """
+    inst = Krita.instance()
+    for rule, setting in _RULE_SETTINGS.items():
+        inst.writeSetting(_SETTINGS_GROUP, setting, ",".join(rules.get(rule, ())))
+    _set_docker_rules(rules)
+
+def _set_docker_rules(rules):
+    global _docker_rules
+    _docker_rules = {
+        rule: _compile_rule_patterns(rules.get(rule, ()))
+        for rule in _RULE_SETTINGS
+        if rules.get(rule)
+    }
+    # Cached plans embed rule decisions
+    _lock_plan_cache.clear()
+
+def _dock_has_rule(dock_widget, rule):
+    compiled = _docker_rules.get(rule)
+    if not compiled:
+        return False
+    names, regex = compiled
+    name = dock_widget.objectName()
+    if name in names:
+        return True
+    return bool(regex and regex.match(name))
+
+def is_docker_excluded(dock_widget):
+    """
+    Returns True if the docker is excluded from locking and title bar changes.
+    """
+    return _dock_has_rule(dock_widget, _RULE_EXCLUDE)
 
-def _get_dock_widgets_in_area(main_window, dock_area):
+def _get_dock_widgets(main_window):
     """
-    Get all dock widgets in the specified area that are not floating.
+    Get all dock widgets of the main window, minus the excluded ones.
     """
     if not main_window:
         return []
-    return [
-        dock for dock in main_window.findChildren(QDockWidget)
-        if main_window.dockWidgetArea(dock) == dock_area and not dock.isFloating()
-    ]
+    docks = main_window.findChildren(QDockWidget)
+    if _RULE_EXCLUDE not in _docker_rules:
+        return docks
+    return [dock for dock in docks if not is_docker_excluded(dock)]
 
-def _get_tab_group_key(main_window, dock_widget):
+def _get_dock_widgets_by_area(main_window, dock_areas, docks):
     """
-    Create a unique identifier for a tab group based on its members.
-    Considers only non-floating docks.
+    Group the non-floating dock widgets by dock area.
+    """
+    docks_by_area = {area: [] for area in dock_areas}
+    if not main_window:
+        return docks_by_area
+    for dock in docks:
+        if dock.isFloating():
+            continue
+        area_docks = docks_by_area.get(main_window.dockWidgetArea(dock))
+        if area_docks is not None:
+            area_docks.append(dock)
+    return docks_by_area
+
+def _get_tab_group(main_window, dock_widget):
+    """
+    Get the non-floating docks of a tab group, starting with the given dock.
     """
     if not main_window or not dock_widget or dock_widget.isFloating():
-        return tuple()
-    
-    # Start with the given dock widget if it's not floating
-    all_docks_in_group = [dock_widget]
-    
-    # Add tabified docks, ensuring they are also not floating
+        return []
     # Note: tabifiedDockWidgets itself returns a list of QDockWidget
-    tabified_list = main_window.tabifiedDockWidgets(dock_widget)
-    for tab_dock in tabified_list:
-        if not tab_dock.isFloating():
-            all_docks_in_group.append(tab_dock)
-            
+    return [dock_widget] + [
+        tab_dock for tab_dock in main_window.tabifiedDockWidgets(dock_widget)
+        if not tab_dock.isFloating()
+    ]
+
+def _get_tab_group_key(tab_group_docks):
+    """
+    Create a unique identifier for a tab group based on its members.
+    """
     # Sort by object name to ensure consistent ordering
-    all_docks_in_group.sort(key=lambda d: d.objectName())
-    return tuple(d.objectName() for d in all_docks_in_group)
+    return tuple(sorted(dock.objectName() for dock in tab_group_docks))
 
 # --- Dock Lock Icon Helpers ---
 
@@ -68,11 +212,28 @@ def _has_utility_title_bar(dock_widget):
     """Check if the dock widget uses a KisUtilityTitleBar which contains
     functional controls (e.g. Animation Timeline, Animation Curves) that
     must remain visible even when the titlebar would normally be collapsed."""
-    title_bar = dock_widget.titleBarWidget()
+    title_bar = _get_title_bar(dock_widget)
     if not title_bar:
         return False
     return title_bar.inherits("KisUtilityTitleBar")
 
+def _dock_lock_axis_is_width(dock_widget, area_locks_width):
+    """
+    Width is locked for Left/Right areas and height for Top/Bottom areas,
+    unless a lock_width or lock_height rule overrides it for this docker.
+    A docker matching both rules has its width locked.
+    """
+    if _dock_has_rule(dock_widget, _RULE_LOCK_WIDTH):
+        return True
+    if _dock_has_rule(dock_widget, _RULE_LOCK_HEIGHT):
+        return False
+    return area_locks_width
+
+def _keeps_title_bar(dock_widget):
+    return _has_utility_title_bar(dock_widget) or _dock_has_rule(
+        dock_widget, _RULE_KEEP_TITLE_BAR
+    )
+
 def _is_lock_docker_button(button):
     if not button:
         return False
@@ -228,10 +389,46 @@ def _apply_title_bar_collapse_style(title_bar):
         combined = _TITLE_BAR_COLLAPSE_STYLE
     title_bar.setStyleSheet(combined)
 
+def _get_title_bar(dock_widget):
+    """
+    Get Krita's title bar of the dock widget, including a parked one.
+    """
+    title_bar = dock_widget.titleBarWidget()
+    if isinstance(title_bar, _TitleBarPlaceholder):
+        return title_bar.parked_title_bar
+    return title_bar
+
+def _get_title_bar_placeholder(dock_widget):
+    # One placeholder per dock, created on first collapse and reused after
+    placeholder = dock_widget.property(_TITLE_BAR_PLACEHOLDER_PROPERTY)
+    if placeholder is None:
+        placeholder = _TitleBarPlaceholder(None, dock_widget)
+        dock_widget.setProperty(_TITLE_BAR_PLACEHOLDER_PROPERTY, placeholder)
+    return placeholder
+
+def _swap_in_title_bar_placeholder(dock_widget, title_bar):
+    # setTitleBarWidget hides the replaced widget but keeps it as a child
+    placeholder = _get_title_bar_placeholder(dock_widget)
+    placeholder.parked_title_bar = title_bar
+    dock_widget.setTitleBarWidget(placeholder)
+
+def _swap_out_title_bar_placeholder(dock_widget, placeholder):
+    # The placeholder stays parked on the dock, hidden, for the next collapse
+    title_bar = placeholder.parked_title_bar
+    dock_widget.setTitleBarWidget(title_bar)
+    if title_bar:
+        title_bar.setVisible(True)
+    placeholder.parked_title_bar = None
+
 def _set_title_bar_visible(dock_widget, visible):
     title_bar = dock_widget.titleBarWidget()
     if not title_bar:
         return
+    if isinstance(title_bar, _TitleBarPlaceholder):
+        if visible:
+            _swap_out_title_bar_placeholder(dock_widget, title_bar)
+            dock_widget.updateGeometry()
+        return
     desired_collapsed = not visible
     current_state = title_bar.property(_TITLE_BAR_COLLAPSED_PROPERTY)
     if current_state is None and visible:
@@ -239,6 +436,11 @@ def _set_title_bar_visible(dock_widget, visible):
     if current_state == desired_collapsed:
         return
 
+    if not visible and _title_bar_strategy == TITLE_BAR_STRATEGY_PLACEHOLDER:
+        _swap_in_title_bar_placeholder(dock_widget, title_bar)
+        dock_widget.updateGeometry()
+        return
+
     if not visible:
         _store_title_bar_state(title_bar)
         _apply_title_bar_collapse_style(title_bar)
@@ -265,7 +467,7 @@ def _set_title_bar_visible(dock_widget, visible):
 
 
 def _iter_lock_buttons(dock_widget):
-    title_bar = dock_widget.titleBarWidget()
+    title_bar = _get_title_bar(dock_widget)
     search_root = title_bar if title_bar else dock_widget
 
     for button in search_root.findChildren(QAbstractButton):
@@ -340,6 +542,182 @@ def _restore_dock_size_constraints(dock_widget):
     dock_widget.setProperty(_DOCK_SIZE_CONSTRAINTS_PROPERTY, None)
     return True
 
+# --- Lock Plan Cache ---
+
+_LOCK_PLAN_CACHE_SIZE = 16
+
+# Docks are addressed by slot, (objectName, occurrence) in dock scan order,
+# so docks sharing an objectName stay distinct.
+# constraints holds (slot, lock_width, size) per dock,
+# title_bars holds (slot, collapse) per dock.
+LockPlan = namedtuple("LockPlan", ["constraints", "title_bars"])
+
+class _LockPlanCache:
+    """
+    Size-bounded LRU cache of lock plans keyed by layout shape.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._plans = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        plan = self._plans.get(key)
+        if plan is None:
+            self.misses += 1
+            return None
+        self._plans.move_to_end(key)
+        self.hits += 1
+        return plan
+
+    def put(self, key, plan):
+        self._plans[key] = plan
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.max_size:
+            self._plans.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._plans.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._plans),
+            "max_size": self.max_size,
+        }
+
+_lock_plan_cache = _LockPlanCache(_LOCK_PLAN_CACHE_SIZE)
+
+def get_lock_plan_cache_stats():
+    """
+    Returns hit, miss and eviction counts of the lock plan cache.
+    """
+    return _lock_plan_cache.stats()
+
+def clear_lock_plan_cache():
+    """
+    Drops all cached lock plans. Statistics are kept.
+    """
+    _lock_plan_cache.clear()
+
+def _get_layout_key(main_window):
+    """
+    Cheap identity of the dock layout. saveState() records the dock areas,
+    tab groups, current tabs, visibility and sizes; the main window size
+    covers what it leaves out.
+    """
+    return (
+        bytes(main_window.saveState().data()),
+        int(main_window.width()),
+        int(main_window.height()),
+    )
+
+def _get_dock_slots(docks):
+    slots = []
+    occurrences = {}
+    for dock in docks:
+        name = dock.objectName()
+        occurrence = occurrences.get(name, 0)
+        occurrences[name] = occurrence + 1
+        slots.append((name, occurrence))
+    return slots
+
+def _measure_tab_groups(main_window, dock_areas, docks):
+    """
+    Collect the tab groups of the rendered docks per area. Also reports
+    whether every visible dock was rendered; a plan measured while docks
+    are covered or not yet painted is missing their constraints.
+    """
+    docks_by_area = _get_dock_widgets_by_area(main_window, dock_areas, docks)
+    tab_groups = []
+    fully_rendered = True
+    for area in dock_areas:
+        # Filter for dock widgets that are actually visible on screen
+        active_rendered_docks = []
+        for dock in docks_by_area[area]:
+            if not dock.isVisible():
+                continue
+            if dock.visibleRegion().isEmpty():
+                fully_rendered = False
+                continue
+            active_rendered_docks.append(dock)
+        processed_groups = set()
+        for active_dock_in_group in active_rendered_docks:
+            tab_group = _get_tab_group(main_window, active_dock_in_group)
+            group_key = _get_tab_group_key(tab_group)
+            if not group_key or group_key in processed_groups:
+                continue
+            processed_groups.add(group_key)
+            tab_groups.append((area, tab_group))
+    return tab_groups, fully_rendered
+
+def _build_lock_plan(tab_groups, docks):
+    slot_by_dock = {
+        id(dock): slot for dock, slot in zip(docks, _get_dock_slots(docks))
+    }
+    constraints = []
+    title_bars = []
+    for area, tab_group in tab_groups:
+        # The first dock is the rendered one, use its size as reference
+        active_dock_in_group = tab_group[0]
+        lock_width = area in (Qt.LeftDockWidgetArea, Qt.RightDockWidgetArea)
+        grouped = len(tab_group) > 1
+        for dock in tab_group:
+            slot = slot_by_dock.get(id(dock))
+            if slot is None: # Excluded docker
+                continue
+            title_bars.append((slot, grouped and not _keeps_title_bar(dock)))
+            if not dock.isVisible(): # Apply only to visible docks in the tab group
+                continue
+            if _dock_lock_axis_is_width(dock, lock_width):
+                constraints.append((slot, True, int(active_dock_in_group.width())))
+            else:
+                constraints.append((slot, False, int(active_dock_in_group.height())))
+    return LockPlan(tuple(constraints), tuple(title_bars))
+
+def _set_dock_lock_constraints(dock_widget, lock_width, size):
+    if lock_width:
+        # Keep height flexible
+        target = (size, size, 0, _MAX_QT_DIMENSION)
+    else:
+        # Keep width flexible
+        target = (0, _MAX_QT_DIMENSION, size, size)
+    current = (
+        dock_widget.minimumWidth(),
+        dock_widget.maximumWidth(),
+        dock_widget.minimumHeight(),
+        dock_widget.maximumHeight(),
+    )
+    if current == target and dock_widget.property(_DOCK_SIZE_CONSTRAINTS_PROPERTY) is not None:
+        return
+    _store_dock_size_constraints(dock_widget)
+    dock_widget.setMinimumWidth(target[0])
+    dock_widget.setMaximumWidth(target[1])
+    dock_widget.setMinimumHeight(target[2])
+    dock_widget.setMaximumHeight(target[3])
+
+def _apply_lock_plan(plan, docks):
+    """
+    Applies the plan to the scanned docks and returns the title bar
+    decisions keyed by id() of the dock widget.
+    """
+    dock_by_slot = dict(zip(_get_dock_slots(docks), docks))
+    for slot, lock_width, size in plan.constraints:
+        dock = dock_by_slot.get(slot)
+        if dock:
+            _set_dock_lock_constraints(dock, lock_width, size)
+    return {
+        id(dock_by_slot[slot]): collapse
+        for slot, collapse in plan.title_bars
+        if slot in dock_by_slot
+    }
+
 # --- Main Functionality ---
 
 def _resolve_main_window(main_window=None):
@@ -351,8 +729,8 @@ def _resolve_main_window(main_window=None):
         return None
     return win.qwindow()
 
-def _update_docker_ui_for_dock(main_window, dock_widget, lock_enabled):
-    if not main_window or not dock_widget:
+def _update_docker_ui_for_dock(main_window, dock_widget, lock_enabled, collapse_title_bar=None):
+    if not main_window or not dock_widget or is_docker_excluded(dock_widget):
         return
     if dock_widget.isFloating():
         _set_title_bar_visible(dock_widget, True)
@@ -360,7 +738,12 @@ def _update_docker_ui_for_dock(main_window, dock_widget, lock_enabled):
         return
 
     if lock_enabled:
-        if _is_grouped_docker(main_window, dock_widget) and not _has_utility_title_bar(dock_widget):
+        if collapse_title_bar is None:
+            collapse_title_bar = (
+                _is_grouped_docker(main_window, dock_widget)
+                and not _keeps_title_bar(dock_widget)
+            )
+        if collapse_title_bar:
             _set_title_bar_visible(dock_widget, False)
         else:
             _set_title_bar_visible(dock_widget, True)
@@ -369,15 +752,20 @@ def _update_docker_ui_for_dock(main_window, dock_widget, lock_enabled):
         _set_lock_buttons_state(dock_widget, False, False)
         _set_title_bar_visible(dock_widget, True)
 
-def update_docker_ui(main_window=None, lock_enabled=False):
+def update_docker_ui(main_window=None, lock_enabled=False, title_bar_decisions=None):
     """
     Updates lock buttons and grouped title bars for all dockers.
+    title_bar_decisions, as returned by lock_docker_resizing, skips the
+    grouping check for the dockers it covers.
     """
     main_window = _resolve_main_window(main_window)
     if not main_window:
         return
-    for dock in main_window.findChildren(QDockWidget):
-        _update_docker_ui_for_dock(main_window, dock, lock_enabled)
+    title_bar_decisions = title_bar_decisions or {}
+    for dock in _get_dock_widgets(main_window):
+        _update_docker_ui_for_dock(
+            main_window, dock, lock_enabled, title_bar_decisions.get(id(dock))
+        )
 
 def update_docker_ui_for_dock(dock_widget, main_window=None, lock_enabled=False):
     """
@@ -395,6 +783,12 @@ def lock_docker_resizing():
     Locks the size of currently visible and non-floating dockers in all standard dock areas.
     Width is locked for Left/Right areas, Height for Top/Bottom areas,
     based on the dimensions of the active dock in each tab group.
+    Excluded dockers are skipped and lock_width/lock_height rules override the axis.
+    Plans are cached by the main window's saveState() and size, so a repeated
+    layout skips the area grouping and tab group walks, and constraints that
+    are already in place are not written again.
+    Returns the title bar decisions for update_docker_ui, or None if there
+    is no active view.
     """
 
     inst = Krita.instance()
@@ -417,57 +811,19 @@ def lock_docker_resizing():
         Qt.BottomDockWidgetArea
     ]
 
-    MAX_QT_DIMENSION = 16777215  # Maximum value for QWidget dimensions
-
-    for area in areas_to_process:
-        dock_widgets_in_area = _get_dock_widgets_in_area(main_window, area)
-        
-        # Filter for dock widgets that are actually visible on screen
-        active_rendered_docks = [
-            dock for dock in dock_widgets_in_area
-            if dock.isVisible() and not dock.visibleRegion().isEmpty()
-        ]
-
-        if not active_rendered_docks:
-            continue
-        
-        processed_groups = set()
-        for active_dock_in_group in active_rendered_docks:
-            # active_dock_in_group is the one currently drawn, use its size as reference
-            
-            group_key = _get_tab_group_key(main_window, active_dock_in_group)
-            if not group_key or group_key in processed_groups: # Skip if no valid group or already processed
-                continue
-            processed_groups.add(group_key)
-
-            # Get all docks that belong to this same tab group
-            # The key already represents all docks in the group, but we need the QDockWidget objects
-            # Re-fetch based on one member (active_dock_in_group)
-            tab_group_docks = [active_dock_in_group] + \
-                              [d for d in main_window.tabifiedDockWidgets(active_dock_in_group) if not d.isFloating()]
-
-
-            if area in (Qt.LeftDockWidgetArea, Qt.RightDockWidgetArea):
-                current_width = active_dock_in_group.width()
-                for dock in tab_group_docks:
-                    if dock.isVisible(): # Apply only to visible docks in the tab group
-                        _store_dock_size_constraints(dock)
-                        dock.setMinimumWidth(current_width)
-                        dock.setMaximumWidth(current_width)
-                        # Keep height flexible
-                        dock.setMinimumHeight(0)
-                        dock.setMaximumHeight(MAX_QT_DIMENSION)
-            elif area in (Qt.TopDockWidgetArea, Qt.BottomDockWidgetArea):
-                current_height = active_dock_in_group.height()
-                for dock in tab_group_docks:
-                    if dock.isVisible(): # Apply only to visible docks in the tab group
-                        _store_dock_size_constraints(dock)
-                        dock.setMinimumHeight(current_height)
-                        dock.setMaximumHeight(current_height)
-                        # Keep width flexible
-                        dock.setMinimumWidth(0)
-                        dock.setMaximumWidth(MAX_QT_DIMENSION)
+    docks = _get_dock_widgets(main_window)
+    layout_key = _get_layout_key(main_window)
+    plan = _lock_plan_cache.get(layout_key)
+    if plan is None:
+        tab_groups, fully_rendered = _measure_tab_groups(
+            main_window, areas_to_process, docks
+        )
+        plan = _build_lock_plan(tab_groups, docks)
+        if fully_rendered:
+            _lock_plan_cache.put(layout_key, plan)
+    title_bar_decisions = _apply_lock_plan(plan, docks)
     # print("Docker resizing locked for visible, non-floating dockers.")
+    return title_bar_decisions
 
 
 def unlock_docker_resizing():
@@ -504,7 +860,7 @@ def enable_docker_lock_buttons(main_window=None):
     main_window = _resolve_main_window(main_window)
     if not main_window:
         return
-    for dock in main_window.findChildren(QDockWidget):
+    for dock in _get_dock_widgets(main_window):
         if dock.isFloating():
             continue
         _set_lock_buttons_state(dock, True, True)
@@ -517,7 +873,7 @@ def disable_docker_lock_buttons(main_window=None):
     main_window = _resolve_main_window(main_window)
     if not main_window:
         return
-    for dock in main_window.findChildren(QDockWidget):
+    for dock in _get_dock_widgets(main_window):
         if dock.isFloating():
             continue
         _set_lock_buttons_state(dock, False, False)
@@ -530,7 +886,7 @@ def pulse_docker_lock_buttons(main_window=None):
     if not main_window:
         return
     dock_widgets = [
-        dock for dock in main_window.findChildren(QDockWidget)
+        dock for dock in _get_dock_widgets(main_window)
         if not dock.isFloating()
     ]
     for dock in dock_widgets:
@@ -546,12 +902,12 @@ def update_grouped_docker_title_bars(main_window=None, hide_grouped=False):
     main_window = _resolve_main_window(main_window)
     if not main_window:
         return
-    for dock in main_window.findChildren(QDockWidget):
+    for dock in _get_dock_widgets(main_window):
         if dock.isFloating():
             _set_title_bar_visible(dock, True)
             continue
         is_grouped = _is_grouped_docker(main_window, dock)
-        if hide_grouped and is_grouped and not _has_utility_title_bar(dock):
+        if hide_grouped and is_grouped and not _keeps_title_bar(dock):
             _set_title_bar_visible(dock, False)
         else:
             _set_title_bar_visible(dock, True)
@@ -1,9 +1,12 @@
-from PyQt5.QtCore import QEvent
+from PyQt5.QtCore import QEvent, QTimer
 from PyQt5.QtWidgets import QDockWidget, QWidget
 
 from krita import Krita, Extension
 
 from .functions import (
+    is_docker_excluded,
+    load_docker_rules,
+    load_title_bar_strategy,
     lock_docker_resizing,
     unlock_docker_resizing,
     update_docker_ui,
@@ -16,14 +19,19 @@ class SuperDockerLockExtension(Extension):
     def __init__(self, parent):
         super().__init__(parent)
 
-        self._action_state = self._load_action_state()
+        self._action_state = False
         self._toggle_action = None
         self._main_window = None
         self._dock_widget_ids = set()
         self._window_ids = set()
         self._notifier_hooked = False
+        self._pending_windows = []
+        self._startup_scheduled = False
 
     def setup(self):
+        self._action_state = self._load_action_state()
+        load_docker_rules()
+        load_title_bar_strategy()
         self._register_document_listener()
 
     def createActions(self,window):
@@ -42,9 +50,9 @@ class SuperDockerLockExtension(Extension):
         action.blockSignals(False)
         self._toggle_action = action
         self._update_action_icon(self._action_state)
-        self._register_window(window)
-        self._apply_action_state(self._action_state)
-        self._register_document_listener()
+        # Dock discovery and the initial lock wait until the window is shown
+        # and the event loop is idle, so they stay off Krita's startup path.
+        self._schedule_window_startup(window)
 
     def _load_action_state(self):
         raw_value = Krita.instance().readSetting("super_docker_lock", "enabled", "false")
@@ -64,15 +72,17 @@ class SuperDockerLockExtension(Extension):
         self._toggle_action.setIcon(Krita.instance().icon(icon_name))
 
     def action_toggleDockerLock(self, checked):
-        self._apply_action_state(checked)
         self._action_state = checked
+        # Windows still pending pick up the new state when their startup runs
+        if self._main_window:
+            self._apply_action_state(checked)
         self._update_action_icon(checked)
         self._persist_action_state(checked)
 
     def _apply_action_state(self, checked):
         if checked:
-            lock_docker_resizing()
-            self._sync_docker_ui()
+            title_bar_decisions = lock_docker_resizing()
+            update_docker_ui(self._main_window, True, title_bar_decisions)
         else:
             unlock_docker_resizing()
             update_docker_ui(self._main_window, False)
@@ -99,14 +109,53 @@ class SuperDockerLockExtension(Extension):
             notifier.viewCreated.connect(self._on_view_created)
         self._notifier_hooked = True
 
-    def _on_window_is_being_created(self, window):
-        if window:
+    def _is_window_pending(self, window):
+        return any(pending is window for pending in self._pending_windows)
+
+    def _is_pending_main_window(self, widget):
+        return any(pending.qwindow() is widget for pending in self._pending_windows)
+
+    def _schedule_window_startup(self, window):
+        if not window or id(window) in self._window_ids:
+            return
+        if not self._is_window_pending(window):
+            self._pending_windows.append(window)
+        qwindow = window.qwindow()
+        if qwindow and not qwindow.isVisible():
+            # Started from the first Show event of the main window
+            qwindow.installEventFilter(self)
+            return
+        self._queue_window_startup()
+
+    def _queue_window_startup(self):
+        if self._startup_scheduled:
+            return
+        self._startup_scheduled = True
+        QTimer.singleShot(0, self._run_window_startup)
+
+    def _run_window_startup(self):
+        self._startup_scheduled = False
+        waiting = []
+        started = False
+        for window in self._pending_windows:
+            qwindow = window.qwindow()
+            if qwindow and not qwindow.isVisible():
+                waiting.append(window)
+                continue
             self._register_window(window)
+            started = True
+        self._pending_windows = waiting
+        if started:
+            self._apply_action_state(self._action_state)
+
+    def _on_window_is_being_created(self, window):
+        self._schedule_window_startup(window)
 
     def _on_window_created(self):
         window = Krita.instance().activeWindow()
-        if window:
-            self._register_window(window)
+        if window and id(window) not in self._window_ids:
+            self._schedule_window_startup(window)
+            return
         if self._action_state:
             self._sync_docker_ui()
         self._register_existing_dock_widgets()
@@ -114,8 +163,9 @@ class SuperDockerLockExtension(Extension):
     def _on_view_created(self, view):
         if view:
             window = view.window()
-            if window:
-                self._register_window(window)
+            if window and id(window) not in self._window_ids:
+                self._schedule_window_startup(window)
+                return
         if self._action_state:
             self._sync_docker_ui()
         self._register_existing_dock_widgets()
@@ -167,7 +217,7 @@ class SuperDockerLockExtension(Extension):
 
     def _register_dock_widget(self, dock):
         dock_id = id(dock)
-        if dock_id in self._dock_widget_ids:
+        if dock_id in self._dock_widget_ids or is_docker_excluded(dock):
             return
         self._dock_widget_ids.add(dock_id)
         dock.destroyed.connect(
@@ -192,9 +242,16 @@ class SuperDockerLockExtension(Extension):
             self._sync_docker_ui_for_dock(dock)
 
     def eventFilter(self, watched, event):
+        if self._pending_windows and self._is_pending_main_window(watched):
+            # Docks added before startup are picked up by its dock scan
+            if event.type() == QEvent.Show:
+                self._queue_window_startup()
+            return False
         if event.type() == QEvent.ChildAdded:
             child = event.child()
             if isinstance(child, QDockWidget):
+                if is_docker_excluded(child):
+                    return False
                 self._register_dock_widget(child)
                 if self._action_state and not child.isFloating():
                     self._sync_docker_ui_for_dock(child)
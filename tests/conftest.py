@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# The stand-in PyQt5 and krita modules record Qt calls instead of drawing,
+# so they take precedence over any installed PyQt5.
+sys.path.insert(0, os.path.join(_TESTS_DIR, "stubs"))
+sys.path.insert(1, os.path.dirname(_TESTS_DIR))
+
+from PyQt5.QtCore import QTimer  # noqa: E402
+from PyQt5.QtWidgets import qt_calls  # noqa: E402
+
+from krita import Krita, Window  # noqa: E402
+
+from super_docker_lock import functions  # noqa: E402
+
+from qt_harness import build_main_window  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    Krita.reset()
+    QTimer.pending = []
+    functions._docker_rules = {}
+    functions._lock_plan_cache = functions._LockPlanCache(
+        functions._LOCK_PLAN_CACHE_SIZE
+    )
+    functions._title_bar_strategy = functions.TITLE_BAR_STRATEGY_STYLE
+    qt_calls.clear()
+    yield
+
+
+@pytest.fixture
+def main_window_factory():
+    """
+    Build an offscreen main window with the given number of dockers and
+    make it Krita's active window.
+    """
+    def factory(dock_count):
+        main_window, docks = build_main_window(dock_count)
+        window = Window(main_window)
+        Krita.instance().active_window = window
+        return window, main_window, docks
+    return factory
+
+
+@pytest.fixture
+def count_qt_calls():
+    """
+    Run a callable and return the Qt calls it made.
+    """
+    def measure(func, *args, **kwargs):
+        qt_calls.clear()
+        func(*args, **kwargs)
+        counts = dict(qt_calls)
+        qt_calls.clear()
+        return counts
+    return measure
@@ -0,0 +1,90 @@
+"""
+Shared layout builders and counter helpers for the Qt-call harness.
+The stand-in PyQt5 and krita modules are put on sys.path by conftest.py.
+"""
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QAbstractButton,
+    QDockWidget,
+    QLayout,
+    QMainWindow,
+    QWidget,
+)
+
+CONSTRAINT_SETTERS = (
+    "setMinimumWidth",
+    "setMaximumWidth",
+    "setMinimumHeight",
+    "setMaximumHeight",
+    "setFixedHeight",
+)
+
+TRACKED_COUNTERS = (
+    "findChildren",
+    "tabifiedDockWidgets",
+    "setStyleSheet",
+    "setProperty",
+    "invalidate",
+    "constraints",
+)
+
+
+def tracked_counts(counts):
+    """
+    Reduce recorded Qt calls to TRACKED_COUNTERS, summing the size
+    constraint setters into "constraints".
+    """
+    tracked = {name: counts.get(name, 0) for name in TRACKED_COUNTERS}
+    tracked["constraints"] = sum(counts.get(name, 0) for name in CONSTRAINT_SETTERS)
+    return tracked
+
+
+_DOCK_AREAS = (
+    Qt.LeftDockWidgetArea,
+    Qt.RightDockWidgetArea,
+    Qt.BottomDockWidgetArea,
+)
+
+
+class KoDockWidgetTitleBar(QWidget):
+    class_name = "KoDockWidgetTitleBar"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        QLayout(self)
+        self.resize(200, 20)
+        close_button = QAbstractButton(self)
+        close_button.setToolTip("Close Docker")
+        lock_button = QAbstractButton(self)
+        lock_button.class_name = "KoDockWidgetTitleBarButton"
+        lock_button.setToolTip("Lock Docker")
+        lock_button.setCheckable(True)
+
+
+class KisUtilityTitleBar(KoDockWidgetTitleBar):
+    class_name = "KisUtilityTitleBar"
+
+
+def make_dock(name, title_bar_class=KoDockWidgetTitleBar):
+    dock = QDockWidget(name)
+    dock.setObjectName(name)
+    dock.setTitleBarWidget(title_bar_class(dock))
+    return dock
+
+
+def build_main_window(dock_count):
+    """
+    Lay out dock_count dockers as tab groups of two, spread over the
+    left, right and bottom dock areas.
+    """
+    main_window = QMainWindow()
+    docks = []
+    for index in range(dock_count):
+        dock = make_dock("Docker{}".format(index))
+        area = _DOCK_AREAS[(index // 2) % len(_DOCK_AREAS)]
+        main_window.addDockWidget(area, dock)
+        if index % 2:
+            main_window.tabifyDockWidget(docks[-1], dock)
+        docks.append(dock)
+    return main_window, docks
@@ -0,0 +1,117 @@
+class Qt:
+    NoDockWidgetArea = 0x0
+    LeftDockWidgetArea = 0x1
+    RightDockWidgetArea = 0x2
+    TopDockWidgetArea = 0x4
+    BottomDockWidgetArea = 0x8
+    WA_StyleSheet = 97
+
+
+class pyqtBoundSignal:
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class QObject:
+
+    def __init__(self, parent=None):
+        self._parent = None
+        self._children = []
+        self._object_name = ""
+        self._event_filters = []
+        self.destroyed = pyqtBoundSignal()
+        if parent is not None:
+            # Subclasses are not initialised yet, so no ChildAdded is sent
+            self._parent = parent
+            parent._children.append(self)
+
+    def parent(self):
+        return self._parent
+
+    def setParent(self, parent):
+        if self._parent is parent:
+            return
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+            for event_filter in list(parent._event_filters):
+                event_filter.eventFilter(parent, QChildEvent(QEvent.ChildAdded, self))
+
+    def children(self):
+        return list(self._children)
+
+    def objectName(self):
+        return self._object_name
+
+    def setObjectName(self, name):
+        self._object_name = name
+
+    def installEventFilter(self, event_filter):
+        if event_filter not in self._event_filters:
+            self._event_filters.append(event_filter)
+
+    def removeEventFilter(self, event_filter):
+        if event_filter in self._event_filters:
+            self._event_filters.remove(event_filter)
+
+    def deleteLater(self):
+        if self._parent is not None:
+            self._parent._children.remove(self)
+            self._parent = None
+        self.destroyed.emit(self)
+
+
+class QByteArray:
+
+    def __init__(self, data=b""):
+        self._data = bytes(data)
+
+    def data(self):
+        return self._data
+
+
+class QEvent:
+    Show = 17
+    ChildAdded = 68
+
+    def __init__(self, event_type):
+        self._type = event_type
+
+    def type(self):
+        return self._type
+
+
+class QChildEvent(QEvent):
+
+    def __init__(self, event_type, child):
+        super().__init__(event_type)
+        self._child = child
+
+    def child(self):
+        return self._child
+
+
+class QTimer:
+    # Callbacks queued by singleShot, run explicitly by the tests
+    pending = []
+
+    @classmethod
+    def singleShot(cls, msec, callback):
+        cls.pending.append((msec, callback))
+
+    @classmethod
+    def run_pending(cls):
+        queued, cls.pending = cls.pending, []
+        for _msec, callback in queued:
+            callback()
+        return len(queued)
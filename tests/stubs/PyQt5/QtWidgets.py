@@ -0,0 +1,411 @@
+from collections import Counter
+
+from .QtCore import QByteArray, QEvent, QObject, Qt, pyqtBoundSignal
+
+QWIDGETSIZE_MAX = 16777215
+
+# Number of calls per tracked Qt method since the last reset
+qt_calls = Counter()
+
+
+def _count(name):
+    qt_calls[name] += 1
+
+
+class _MetaObject:
+
+    def __init__(self, class_name):
+        self._class_name = class_name
+
+    def className(self):
+        return self._class_name
+
+
+class _Margins:
+
+    def __init__(self, left=0, top=0, right=0, bottom=0):
+        self._values = (left, top, right, bottom)
+
+    def left(self):
+        return self._values[0]
+
+    def top(self):
+        return self._values[1]
+
+    def right(self):
+        return self._values[2]
+
+    def bottom(self):
+        return self._values[3]
+
+
+class _Region:
+
+    def __init__(self, empty):
+        self._empty = empty
+
+    def isEmpty(self):
+        return self._empty
+
+
+class _Style:
+
+    def polish(self, widget):
+        _count("polish")
+
+    def unpolish(self, widget):
+        _count("unpolish")
+
+
+_STYLE = _Style()
+
+
+class QSizePolicy:
+    Fixed = 0
+    Minimum = 1
+    Preferred = 5
+    Expanding = 7
+    ControlType = int
+    DefaultType = 0x1
+
+    def __init__(self, horizontal=Preferred, vertical=Preferred):
+        self._horizontal = horizontal
+        self._vertical = vertical
+        self._control_type = QSizePolicy.DefaultType
+
+    def horizontalPolicy(self):
+        return self._horizontal
+
+    def verticalPolicy(self):
+        return self._vertical
+
+    def controlType(self):
+        return self._control_type
+
+    def setControlType(self, control_type):
+        self._control_type = control_type
+
+
+class QLayout(QObject):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._margins = _Margins(2, 2, 2, 2)
+        self._spacing = 4
+        if parent is not None:
+            parent._layout = self
+
+    def contentsMargins(self):
+        return self._margins
+
+    def setContentsMargins(self, left, top, right, bottom):
+        _count("setLayoutContentsMargins")
+        self._margins = _Margins(left, top, right, bottom)
+
+    def spacing(self):
+        return self._spacing
+
+    def setSpacing(self, spacing):
+        _count("setSpacing")
+        self._spacing = spacing
+
+    def invalidate(self):
+        _count("invalidate")
+
+
+class QWidget(QObject):
+    class_name = "QWidget"
+    inherited_class_names = ()
+
+    def __init__(self, parent=None):
+        _count("QWidget")
+        super().__init__(parent)
+        self._layout = None
+        self._properties = {}
+        self._attributes = {}
+        self._style_sheet = ""
+        self._visible = True
+        self._rendered = True
+        self._enabled = True
+        self._width = 200
+        self._height = 150
+        self._min_width = 0
+        self._max_width = QWIDGETSIZE_MAX
+        self._min_height = 0
+        self._max_height = QWIDGETSIZE_MAX
+        self._size_policy = QSizePolicy()
+        self._margins = _Margins()
+
+    def metaObject(self):
+        return _MetaObject(self.class_name)
+
+    def inherits(self, class_name):
+        return class_name == self.class_name or class_name in self.inherited_class_names
+
+    def parentWidget(self):
+        parent = self.parent()
+        return parent if isinstance(parent, QWidget) else None
+
+    def findChildren(self, cls):
+        _count("findChildren")
+        found = []
+        stack = list(self._children)
+        while stack:
+            child = stack.pop(0)
+            if isinstance(child, cls):
+                found.append(child)
+            stack.extend(child._children)
+        return found
+
+    def layout(self):
+        return self._layout
+
+    def style(self):
+        return _STYLE
+
+    def setProperty(self, name, value):
+        _count("setProperty")
+        if value is None:
+            self._properties.pop(name, None)
+        else:
+            self._properties[name] = value
+        return True
+
+    def property(self, name):
+        return self._properties.get(name)
+
+    def styleSheet(self):
+        return self._style_sheet
+
+    def setStyleSheet(self, style_sheet):
+        _count("setStyleSheet")
+        self._style_sheet = style_sheet
+        if style_sheet:
+            self._attributes[Qt.WA_StyleSheet] = True
+
+    def testAttribute(self, attribute):
+        return self._attributes.get(attribute, False)
+
+    def setAttribute(self, attribute, on=True):
+        self._attributes[attribute] = on
+
+    def isVisible(self):
+        return self._visible
+
+    def setVisible(self, visible):
+        _count("setVisible")
+        shown = bool(visible) and not self._visible
+        self._visible = bool(visible)
+        if shown:
+            for event_filter in list(self._event_filters):
+                event_filter.eventFilter(self, QEvent(QEvent.Show))
+
+    def show(self):
+        self.setVisible(True)
+
+    def hide(self):
+        self.setVisible(False)
+
+    def deleteLater(self):
+        _count("deleteLater")
+        super().deleteLater()
+
+    def visibleRegion(self):
+        _count("visibleRegion")
+        return _Region(not (self._visible and self._rendered))
+
+    def isEnabled(self):
+        return self._enabled
+
+    def setEnabled(self, enabled):
+        self._enabled = bool(enabled)
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def resize(self, width, height):
+        self._width = width
+        self._height = height
+
+    def minimumWidth(self):
+        return self._min_width
+
+    def maximumWidth(self):
+        return self._max_width
+
+    def minimumHeight(self):
+        return self._min_height
+
+    def maximumHeight(self):
+        return self._max_height
+
+    def setMinimumWidth(self, value):
+        _count("setMinimumWidth")
+        self._min_width = value
+
+    def setMaximumWidth(self, value):
+        _count("setMaximumWidth")
+        self._max_width = value
+
+    def setMinimumHeight(self, value):
+        _count("setMinimumHeight")
+        self._min_height = value
+
+    def setMaximumHeight(self, value):
+        _count("setMaximumHeight")
+        self._max_height = value
+
+    def setFixedHeight(self, value):
+        _count("setFixedHeight")
+        self._min_height = value
+        self._max_height = value
+
+    def sizePolicy(self):
+        return self._size_policy
+
+    def setSizePolicy(self, *args):
+        _count("setSizePolicy")
+        if len(args) == 2:
+            self._size_policy = QSizePolicy(args[0], args[1])
+        else:
+            self._size_policy = args[0]
+
+    def contentsMargins(self):
+        return self._margins
+
+    def setContentsMargins(self, left, top, right, bottom):
+        _count("setContentsMargins")
+        self._margins = _Margins(left, top, right, bottom)
+
+    def updateGeometry(self):
+        _count("updateGeometry")
+
+    def update(self):
+        _count("update")
+
+
+class QAbstractButton(QWidget):
+    class_name = "QAbstractButton"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tool_tip = ""
+        self._text = ""
+        self._checkable = False
+        self._checked = False
+
+    def toolTip(self):
+        return self._tool_tip
+
+    def setToolTip(self, tool_tip):
+        self._tool_tip = tool_tip
+
+    def text(self):
+        return self._text
+
+    def accessibleName(self):
+        return ""
+
+    def accessibleDescription(self):
+        return ""
+
+    def statusTip(self):
+        return ""
+
+    def isCheckable(self):
+        return self._checkable
+
+    def setCheckable(self, checkable):
+        self._checkable = checkable
+
+    def isChecked(self):
+        return self._checked
+
+    def setChecked(self, checked):
+        _count("setChecked")
+        self._checked = checked
+
+
+class QDockWidget(QWidget):
+    class_name = "QDockWidget"
+
+    def __init__(self, title="", parent=None):
+        super().__init__(parent)
+        self._title_bar = None
+        self._floating = False
+        self.dockLocationChanged = pyqtBoundSignal()
+        self.topLevelChanged = pyqtBoundSignal()
+
+    def titleBarWidget(self):
+        return self._title_bar
+
+    def setTitleBarWidget(self, widget):
+        _count("setTitleBarWidget")
+        # Like Qt, the replaced widget is hidden but stays a child of the dock
+        if self._title_bar is not None:
+            self._title_bar.hide()
+        self._title_bar = widget
+        if widget is not None:
+            if widget.parent() is not self:
+                widget.setParent(self)
+            widget.show()
+
+    def isFloating(self):
+        return self._floating
+
+    def setFloating(self, floating):
+        self._floating = floating
+        self.topLevelChanged.emit(floating)
+
+
+class QMainWindow(QWidget):
+    class_name = "QMainWindow"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dock_areas = {}
+        self._tab_groups = {}
+        self.resize(1600, 900)
+
+    def addDockWidget(self, area, dock):
+        dock.setParent(self)
+        self._dock_areas[dock] = area
+        self._tab_groups[dock] = [dock]
+
+    def tabifyDockWidget(self, first, second):
+        group = self._tab_groups[first]
+        self._tab_groups[second].remove(second)
+        group.append(second)
+        self._tab_groups[second] = group
+        self._dock_areas[second] = self._dock_areas[first]
+        # The newly tabified dock becomes the current tab
+        for dock in group:
+            dock.setVisible(dock is second)
+
+    def dockWidgetArea(self, dock):
+        return self._dock_areas.get(dock, Qt.NoDockWidgetArea)
+
+    def saveState(self):
+        _count("saveState")
+        # Like Qt, the state records areas, tab groups, visibility and sizes
+        state = []
+        for dock, area in self._dock_areas.items():
+            group = self._tab_groups[dock]
+            state.append((
+                dock.objectName(),
+                area,
+                group.index(dock),
+                group[0].objectName(),
+                dock.isVisible(),
+                dock.isFloating(),
+                dock.width(),
+                dock.height(),
+            ))
+        return QByteArray(repr(state).encode())
+
+    def tabifiedDockWidgets(self, dock):
+        _count("tabifiedDockWidgets")
+        return [other for other in self._tab_groups.get(dock, ()) if other is not dock]
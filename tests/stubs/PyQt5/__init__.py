@@ -0,0 +1,4 @@
+"""
+Recording stand-in for the parts of PyQt5 the plugin uses.
+Every tracked Qt call increments a counter in QtWidgets.qt_calls.
+"""
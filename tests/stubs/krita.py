@@ -0,0 +1,124 @@
+"""
+Stand-in for Krita's Python API, just enough to load the plugin.
+"""
+
+from PyQt5.QtCore import QObject, pyqtBoundSignal
+
+
+class Extension(QObject):
+
+    def __init__(self, parent=None):
+        super().__init__()
+
+
+class Action:
+
+    def __init__(self, name):
+        self.name = name
+        self.toggled = pyqtBoundSignal()
+        self._checked = False
+        self._signals_blocked = False
+        self.icon = None
+
+    def setCheckable(self, checkable):
+        pass
+
+    def setIconText(self, text):
+        pass
+
+    def setIcon(self, icon):
+        self.icon = icon
+
+    def blockSignals(self, blocked):
+        self._signals_blocked = blocked
+
+    def isChecked(self):
+        return self._checked
+
+    def setChecked(self, checked):
+        changed = checked != self._checked
+        self._checked = checked
+        if changed and not self._signals_blocked:
+            self.toggled.emit(checked)
+
+
+class View:
+
+    def __init__(self, window):
+        self._window = window
+
+    def window(self):
+        return self._window
+
+
+class Window:
+
+    def __init__(self, qwindow):
+        self._qwindow = qwindow
+        self._active_view = View(self)
+        self.actions = {}
+        self.activeViewChanged = pyqtBoundSignal()
+        self.windowClosed = pyqtBoundSignal()
+
+    def qwindow(self):
+        return self._qwindow
+
+    def activeView(self):
+        return self._active_view
+
+    def setActiveView(self, view):
+        self._active_view = view
+
+    def createAction(self, name, text, menu_location):
+        action = Action(name)
+        self.actions[name] = action
+        return action
+
+
+class Notifier:
+
+    def __init__(self):
+        self.windowCreated = pyqtBoundSignal()
+        self.windowIsBeingCreated = pyqtBoundSignal()
+        self.viewCreated = pyqtBoundSignal()
+
+    def setActive(self, active):
+        pass
+
+
+class Krita:
+    _instance = None
+
+    def __init__(self):
+        self.settings = {}
+        self.extensions = []
+        self.active_window = None
+        self._notifier = Notifier()
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    def readSetting(self, group, name, default):
+        return self.settings.get((group, name), default)
+
+    def writeSetting(self, group, name, value):
+        self.settings[(group, name)] = value
+
+    def activeWindow(self):
+        return self.active_window
+
+    def notifier(self):
+        return self._notifier
+
+    def icon(self, name):
+        return name
+
+    def addExtension(self, extension):
+        self.extensions.append(extension)
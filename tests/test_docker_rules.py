@@ -0,0 +1,48 @@
+from krita import Krita
+
+from super_docker_lock import functions
+from super_docker_lock.functions import (
+    is_docker_excluded,
+    load_docker_rules,
+    lock_docker_resizing,
+    save_docker_rules,
+)
+
+_STORED = "_super_docker_lock_dock_size_constraints"
+
+
+def _setting(name):
+    return Krita.instance().readSetting("super_docker_lock", name, None)
+
+
+def test_save_docker_rules_persists_and_recompiles(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    save_docker_rules({
+        "exclude": ["Docker1", "Docker5"],
+        "lock_height": ["Docker3*"],
+    })
+
+    assert _setting("exclude_dockers") == "Docker1,Docker5"
+    assert _setting("lock_height_dockers") == "Docker3*"
+    assert _setting("lock_width_dockers") == ""
+    assert _setting("keep_title_bar_dockers") == ""
+    assert is_docker_excluded(docks[1]) and is_docker_excluded(docks[5])
+    assert not is_docker_excluded(docks[3])
+
+    lock_docker_resizing()
+    assert docks[1].property(_STORED) is None
+    # Docker3 sits in the right area, the rule locks its height instead of its width
+    assert docks[3].maximumHeight() == docks[3].height()
+    assert docks[3].maximumWidth() == functions._MAX_QT_DIMENSION
+
+
+def test_saved_rules_round_trip_through_load():
+    rules = {
+        "exclude": ["Animation*"],
+        "lock_width": ["ToolBox"],
+        "lock_height": [],
+        "keep_title_bar": ["LayerBox", "Palette?"],
+    }
+    save_docker_rules(rules)
+    functions._docker_rules = {}
+    assert load_docker_rules() == rules
@@ -0,0 +1,123 @@
+from krita import Krita
+
+from super_docker_lock import functions
+from super_docker_lock.functions import (
+    get_lock_plan_cache_stats,
+    lock_docker_resizing,
+    unlock_docker_resizing,
+)
+
+from qt_harness import make_dock, tracked_counts
+
+_STORED = "_super_docker_lock_dock_size_constraints"
+
+
+def _is_locked(dock):
+    return dock.property(_STORED) is not None
+
+
+def test_repeated_lock_hits_cache(main_window_factory):
+    main_window_factory(6)
+    lock_docker_resizing()
+    unlock_docker_resizing()
+    lock_docker_resizing()
+    stats = get_lock_plan_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_cache_hit_skips_layout_measurement(main_window_factory, count_qt_calls):
+    main_window_factory(12)
+    miss = count_qt_calls(lock_docker_resizing)
+    unlock_docker_resizing()
+    hit = count_qt_calls(lock_docker_resizing)
+    assert get_lock_plan_cache_stats()["hits"] == 1
+    assert miss.get("tabifiedDockWidgets") and miss.get("visibleRegion")
+    assert hit.get("tabifiedDockWidgets", 0) == 0
+    assert hit.get("visibleRegion", 0) == 0
+    assert hit.get("findChildren") == 1 and hit.get("saveState") == 1
+    # The constraints restored by the unlock are written again
+    assert tracked_counts(hit)["constraints"] == tracked_counts(miss)["constraints"]
+
+
+def test_relock_while_locked_writes_nothing(main_window_factory, count_qt_calls):
+    main_window_factory(6)
+    lock_docker_resizing()
+    counts = tracked_counts(count_qt_calls(lock_docker_resizing))
+    assert counts["constraints"] == 0
+    assert counts["setProperty"] == 0
+
+
+def test_regrouped_layout_misses_cache(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    lock_docker_resizing()
+    unlock_docker_resizing()
+    extra = make_dock("ExtraDocker")
+    main_window.addDockWidget(main_window.dockWidgetArea(docks[0]), extra)
+    main_window.tabifyDockWidget(docks[1], extra)
+    lock_docker_resizing()
+    stats = get_lock_plan_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (0, 2)
+    assert _is_locked(extra)
+
+
+def test_cache_evicts_least_recently_used(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    max_size = functions._LOCK_PLAN_CACHE_SIZE
+    for width in range(max_size + 2):
+        main_window.resize(1000 + width, 900)
+        lock_docker_resizing()
+    stats = get_lock_plan_cache_stats()
+    assert stats["evictions"] == 2
+    assert stats["size"] == max_size
+
+
+def test_resized_dock_is_locked_to_its_new_size(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    dock = docks[1]
+    lock_docker_resizing()
+    unlock_docker_resizing()
+    dock.resize(321, dock.height())
+    lock_docker_resizing()
+    assert get_lock_plan_cache_stats()["hits"] == 0
+    assert (dock.minimumWidth(), dock.maximumWidth()) == (321, 321)
+
+
+def test_unrendered_first_lock_does_not_poison_cache(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    for dock in docks:
+        dock._rendered = False
+    lock_docker_resizing()
+    assert not any(_is_locked(dock) for dock in docks)
+    assert get_lock_plan_cache_stats()["size"] == 0
+
+    for dock in docks:
+        dock._rendered = True
+    lock_docker_resizing()
+    assert all(_is_locked(dock) for dock in docks if dock.isVisible())
+
+
+def test_group_is_locked_through_its_rendered_member(main_window_factory):
+    window, main_window, docks = main_window_factory(2)
+    hidden, rendered = docks
+    hidden.setVisible(True)
+    hidden._rendered = False
+    lock_docker_resizing()
+    assert _is_locked(rendered)
+
+
+def test_docks_sharing_an_object_name_are_all_locked(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    for dock in docks:
+        dock.setObjectName("")
+    lock_docker_resizing()
+    visible_docks = [dock for dock in docks if dock.isVisible()]
+    assert len(visible_docks) == 3
+    assert all(_is_locked(dock) for dock in visible_docks)
+
+
+def test_rule_change_clears_cached_plans(main_window_factory):
+    main_window_factory(6)
+    lock_docker_resizing()
+    Krita.instance().writeSetting("super_docker_lock", "exclude_dockers", "Docker1")
+    functions.load_docker_rules()
+    assert get_lock_plan_cache_stats()["size"] == 0
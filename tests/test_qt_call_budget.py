@@ -0,0 +1,217 @@
+"""
+Qt-call budgets for locking, unlocking and syncing the dockers.
+
+Timings are noisy, but the number of Qt calls made by each operation is
+deterministic. Every operation declares a budget of (per_dock, constant)
+calls per tracked counter and is run at several dock counts, so an
+operation that grows quadratically with the dock count fails here.
+"""
+
+import pytest
+
+from PyQt5.QtCore import QEvent, QTimer
+
+from krita import Krita
+
+from super_docker_lock.functions import (
+    clear_lock_plan_cache,
+    lock_docker_resizing,
+    unlock_docker_resizing,
+    update_docker_ui,
+)
+from super_docker_lock.super_docker_lock import SuperDockerLockExtension
+
+from qt_harness import TRACKED_COUNTERS, make_dock, tracked_counts
+
+DOCK_COUNTS = (6, 12, 24)
+
+
+def _start_extension(window, enabled=False):
+    if enabled:
+        Krita.instance().writeSetting("super_docker_lock", "enabled", "true")
+    extension = SuperDockerLockExtension(Krita.instance())
+    extension.setup()
+    extension.createActions(window)
+    QTimer.run_pending()
+    return extension
+
+
+# --- Operations ---
+
+def _lock(measure, window, main_window, docks):
+    clear_lock_plan_cache()
+    return measure(lock_docker_resizing)
+
+
+def _unlock(measure, window, main_window, docks):
+    lock_docker_resizing()
+    return measure(unlock_docker_resizing)
+
+
+def _sync_locked(measure, window, main_window, docks):
+    return measure(update_docker_ui, main_window, True)
+
+
+def _sync_unlocked(measure, window, main_window, docks):
+    update_docker_ui(main_window, True)
+    return measure(update_docker_ui, main_window, False)
+
+
+def _create_actions(measure, window, main_window, docks):
+    extension = SuperDockerLockExtension(Krita.instance())
+    extension.setup()
+    return measure(extension.createActions, window)
+
+
+def _deferred_startup(measure, window, main_window, docks):
+    extension = SuperDockerLockExtension(Krita.instance())
+    extension.setup()
+    extension.createActions(window)
+    return measure(QTimer.run_pending)
+
+
+def _toggle_on(measure, window, main_window, docks):
+    _start_extension(window)
+    return measure(window.actions["super_docker_lock"].setChecked, True)
+
+
+def _toggle_off(measure, window, main_window, docks):
+    _start_extension(window, enabled=True)
+    return measure(window.actions["super_docker_lock"].setChecked, False)
+
+
+def _active_view_changed(measure, window, main_window, docks):
+    _start_extension(window, enabled=True)
+    return measure(window.activeViewChanged.emit)
+
+
+def _dock_shown(measure, window, main_window, docks):
+    extension = _start_extension(window, enabled=True)
+    return measure(extension.eventFilter, docks[0], QEvent(QEvent.Show))
+
+
+def _dock_location_changed(measure, window, main_window, docks):
+    _start_extension(window, enabled=True)
+    return measure(docks[2].dockLocationChanged.emit, docks[2])
+
+
+def _dock_added(measure, window, main_window, docks):
+    _start_extension(window, enabled=True)
+    dock = make_dock("AddedDocker")
+    return measure(main_window.addDockWidget, main_window.dockWidgetArea(docks[0]), dock)
+
+
+# (per_dock, constant) call budgets; counters left out must stay at zero
+BUDGETS = {
+    _lock: {
+        "findChildren": (0, 1),
+        "tabifiedDockWidgets": (1, 0),
+        "setProperty": (1, 0),
+        "constraints": (4, 0),
+    },
+    _unlock: {
+        "findChildren": (0, 1),
+        "setProperty": (1, 0),
+        "constraints": (4, 0),
+    },
+    _sync_locked: {
+        "findChildren": (1, 1),
+        "tabifiedDockWidgets": (1, 0),
+        "setStyleSheet": (1, 0),
+        "setProperty": (9, 0),
+        "invalidate": (2, 0),
+        "constraints": (3, 0),
+    },
+    _sync_unlocked: {
+        "findChildren": (1, 1),
+        "setStyleSheet": (1, 0),
+        "setProperty": (9, 0),
+        "invalidate": (2, 0),
+        "constraints": (2, 0),
+    },
+    _create_actions: {},
+    _deferred_startup: {
+        "findChildren": (3, 4),
+        "setProperty": (1, 0),
+        "invalidate": (2, 0),
+    },
+    _toggle_on: {
+        "findChildren": (1, 2),
+        "tabifiedDockWidgets": (1, 0),
+        "setStyleSheet": (1, 0),
+        "setProperty": (10, 0),
+        "invalidate": (2, 0),
+        "constraints": (5, 0),
+    },
+    _toggle_off: {
+        "findChildren": (3, 6),
+        "setStyleSheet": (1, 0),
+        "setProperty": (10, 2),
+        "invalidate": (4, 3),
+        "constraints": (4, 0),
+    },
+    _active_view_changed: {
+        "findChildren": (1, 1),
+        "tabifiedDockWidgets": (1, 0),
+    },
+    _dock_shown: {
+        "findChildren": (0, 1),
+        "tabifiedDockWidgets": (0, 1),
+    },
+    _dock_location_changed: {
+        "findChildren": (0, 1),
+        "tabifiedDockWidgets": (0, 1),
+    },
+    _dock_added: {
+        "findChildren": (0, 1),
+        "tabifiedDockWidgets": (0, 1),
+        "invalidate": (0, 1),
+    },
+}
+
+
+def _measure_operation(operation, main_window_factory, count_qt_calls, dock_count):
+    window, main_window, docks = main_window_factory(dock_count)
+    return tracked_counts(operation(count_qt_calls, window, main_window, docks))
+
+
+@pytest.mark.parametrize("operation", list(BUDGETS), ids=lambda op: op.__name__.lstrip("_"))
+@pytest.mark.parametrize("dock_count", DOCK_COUNTS)
+def test_qt_calls_within_budget(operation, dock_count, main_window_factory, count_qt_calls):
+    counts = _measure_operation(operation, main_window_factory, count_qt_calls, dock_count)
+    budget = BUDGETS[operation]
+    for name in TRACKED_COUNTERS:
+        per_dock, constant = budget.get(name, (0, 0))
+        limit = per_dock * dock_count + constant
+        assert counts[name] <= limit, (
+            "{} made {} {} calls with {} dockers, budget is {}".format(
+                operation.__name__, counts[name], name, dock_count, limit
+            )
+        )
+
+
+@pytest.mark.parametrize("operation", list(BUDGETS), ids=lambda op: op.__name__.lstrip("_"))
+def test_qt_calls_grow_at_most_linearly(operation, main_window_factory, count_qt_calls):
+    dock_count = DOCK_COUNTS[0]
+    small = _measure_operation(operation, main_window_factory, count_qt_calls, dock_count)
+    large = _measure_operation(operation, main_window_factory, count_qt_calls, dock_count * 2)
+    for name in TRACKED_COUNTERS:
+        assert large[name] <= 2 * small[name], (
+            "{} {} calls grew from {} to {} when the dockers doubled".format(
+                operation.__name__, name, small[name], large[name]
+            )
+        )
+
+
+def test_lock_constrains_only_rendered_docks(main_window_factory):
+    window, main_window, docks = main_window_factory(6)
+    lock_docker_resizing()
+    for dock in docks:
+        if dock.isVisible():
+            assert dock.property("_super_docker_lock_dock_size_constraints") is not None
+        else:
+            assert dock.property("_super_docker_lock_dock_size_constraints") is None
+    unlock_docker_resizing()
+    assert all(
+        dock.property("_super_docker_lock_dock_size_constraints") is None for dock in docks
+    )
@@ -0,0 +1,60 @@
+from PyQt5.QtCore import QTimer
+
+from krita import Krita, Window
+
+from super_docker_lock.super_docker_lock import SuperDockerLockExtension
+
+from qt_harness import build_main_window, make_dock
+
+_STORED = "_super_docker_lock_dock_size_constraints"
+
+
+def _extension(window):
+    extension = SuperDockerLockExtension(Krita.instance())
+    extension.setup()
+    extension.createActions(window)
+    return extension
+
+
+def test_hidden_window_starts_on_first_show(main_window_factory, count_qt_calls):
+    Krita.instance().writeSetting("super_docker_lock", "enabled", "true")
+    window, main_window, docks = main_window_factory(4)
+    main_window.hide()
+    extension = _extension(window)
+    # Nothing polls while the window is hidden
+    assert QTimer.pending == []
+
+    # Docks added while the window is being built wait for the startup scan
+    counts = count_qt_calls(main_window.addDockWidget, 1, make_dock("LateDocker"))
+    assert counts == {}
+
+    main_window.show()
+    assert len(QTimer.pending) == 1
+    QTimer.run_pending()
+    assert extension._main_window is main_window
+    assert extension._pending_windows == []
+    assert any(dock.property(_STORED) is not None for dock in docks)
+    assert QTimer.pending == []
+
+
+def test_visible_window_starts_when_event_loop_is_idle(main_window_factory):
+    window, main_window, docks = main_window_factory(4)
+    extension = _extension(window)
+    assert extension._main_window is None
+    assert len(QTimer.pending) == 1
+    QTimer.run_pending()
+    assert extension._main_window is main_window
+
+
+def test_toggle_applies_to_started_window_while_another_is_pending(main_window_factory):
+    window, main_window, docks = main_window_factory(4)
+    extension = _extension(window)
+    QTimer.run_pending()
+
+    hidden_main_window, _hidden_docks = build_main_window(4)
+    hidden_main_window.hide()
+    extension._on_window_is_being_created(Window(hidden_main_window))
+    assert extension._pending_windows
+
+    window.actions["super_docker_lock"].setChecked(True)
+    assert any(dock.property(_STORED) is not None for dock in docks)
@@ -0,0 +1,155 @@
+"""
+Collapse/restore cost of the two title bar strategies, measured in Qt
+calls on the recording harness, and placeholder behaviour.
+"""
+
+import pytest
+
+from krita import Krita
+
+from super_docker_lock import functions
+from super_docker_lock.functions import (
+    TITLE_BAR_STRATEGY_PLACEHOLDER,
+    TITLE_BAR_STRATEGY_STYLE,
+    load_title_bar_strategy,
+    update_docker_ui,
+)
+
+from qt_harness import KisUtilityTitleBar, make_dock
+
+DOCK_COUNT = 12
+
+
+def _use_strategy(strategy):
+    Krita.instance().writeSetting("super_docker_lock", "title_bar_strategy", strategy)
+    assert load_title_bar_strategy() == strategy
+
+
+def _widget_state(widget):
+    return (
+        widget.styleSheet(),
+        widget.minimumHeight(),
+        widget.maximumHeight(),
+        widget.contentsMargins()._values,
+        widget.layout().contentsMargins()._values,
+        widget.layout().spacing(),
+        dict(widget._properties),
+    )
+
+
+def _collapse_and_restore(strategy, main_window_factory, count_qt_calls):
+    """
+    Collapse and restore every title bar twice, recording every Qt call,
+    including widget construction, setTitleBarWidget, show/hide and
+    deleteLater. The second cycle shows the steady-state cost of a toggle.
+    """
+    _use_strategy(strategy)
+    window, main_window, docks = main_window_factory(DOCK_COUNT)
+    cycles = []
+    for _ in range(2):
+        collapse = count_qt_calls(update_docker_ui, main_window, True)
+        restore = count_qt_calls(update_docker_ui, main_window, False)
+        cycles.append((collapse, restore))
+    return cycles
+
+
+def test_placeholder_strategy_is_cheaper_than_style(main_window_factory, count_qt_calls):
+    style_cycles = _collapse_and_restore(
+        TITLE_BAR_STRATEGY_STYLE, main_window_factory, count_qt_calls
+    )
+    placeholder_cycles = _collapse_and_restore(
+        TITLE_BAR_STRATEGY_PLACEHOLDER, main_window_factory, count_qt_calls
+    )
+    print("\nAll Qt calls for {} dockers (collapse / restore)".format(DOCK_COUNT))
+    for cycle, (style, placeholder) in enumerate(zip(style_cycles, placeholder_cycles), 1):
+        print("  cycle {}: style {:>4} / {:<4} placeholder {:>4} / {:<4}".format(
+            cycle,
+            sum(style[0].values()), sum(style[1].values()),
+            sum(placeholder[0].values()), sum(placeholder[1].values()),
+        ))
+
+    for style, placeholder in zip(style_cycles, placeholder_cycles):
+        for style_counts, placeholder_counts in zip(style, placeholder):
+            assert sum(placeholder_counts.values()) < sum(style_counts.values())
+            assert placeholder_counts.get("setStyleSheet", 0) == 0
+            assert placeholder_counts.get("deleteLater", 0) == 0
+    # Placeholders are built once per dock and reused on later toggles
+    first_collapse = placeholder_cycles[0][0]
+    assert first_collapse["QWidget"] == DOCK_COUNT
+    for counts in placeholder_cycles[1]:
+        assert counts.get("QWidget", 0) == 0
+        assert counts.get("setProperty", 0) == 0
+
+
+def test_placeholder_is_reused_across_toggles(main_window_factory):
+    _use_strategy(TITLE_BAR_STRATEGY_PLACEHOLDER)
+    window, main_window, docks = main_window_factory(2)
+    update_docker_ui(main_window, True)
+    placeholder = docks[0].titleBarWidget()
+    update_docker_ui(main_window, False)
+    assert placeholder.parent() is docks[0]
+    assert not placeholder.isVisible()
+    assert placeholder.parked_title_bar is None
+
+    update_docker_ui(main_window, True)
+    assert docks[0].titleBarWidget() is placeholder
+    assert placeholder.isVisible()
+    assert len(docks[0].findChildren(functions._TitleBarPlaceholder)) == 1
+
+
+def test_placeholder_strategy_never_touches_the_original_title_bar(main_window_factory):
+    _use_strategy(TITLE_BAR_STRATEGY_PLACEHOLDER)
+    window, main_window, docks = main_window_factory(4)
+    title_bars = [dock.titleBarWidget() for dock in docks]
+    before = [_widget_state(title_bar) for title_bar in title_bars]
+
+    update_docker_ui(main_window, True)
+    for dock, title_bar in zip(docks, title_bars):
+        placeholder = dock.titleBarWidget()
+        assert isinstance(placeholder, functions._TitleBarPlaceholder)
+        assert placeholder.parked_title_bar is title_bar
+        assert placeholder.maximumHeight() == 0
+        assert not title_bar.isVisible()
+
+    update_docker_ui(main_window, False)
+    for dock, title_bar in zip(docks, title_bars):
+        assert dock.titleBarWidget() is title_bar
+        assert title_bar.isVisible()
+    # Lock buttons are toggled on the parked title bar, the rest is untouched
+    assert [_widget_state(title_bar) for title_bar in title_bars] == before
+
+
+def test_placeholder_strategy_manages_parked_lock_buttons(main_window_factory):
+    _use_strategy(TITLE_BAR_STRATEGY_PLACEHOLDER)
+    window, main_window, docks = main_window_factory(2)
+    update_docker_ui(main_window, True)
+    buttons = list(functions._iter_lock_buttons(docks[0]))
+    assert buttons and all(button.isChecked() for button in buttons)
+    assert not any(button.isVisible() for button in buttons)
+
+
+@pytest.mark.parametrize("strategy", (TITLE_BAR_STRATEGY_STYLE, TITLE_BAR_STRATEGY_PLACEHOLDER))
+def test_utility_title_bars_are_never_collapsed(strategy, main_window_factory):
+    _use_strategy(strategy)
+    window, main_window, docks = main_window_factory(2)
+    utility_dock = make_dock("TimelineDocker", KisUtilityTitleBar)
+    main_window.addDockWidget(main_window.dockWidgetArea(docks[0]), utility_dock)
+    main_window.tabifyDockWidget(docks[1], utility_dock)
+    title_bar = utility_dock.titleBarWidget()
+
+    update_docker_ui(main_window, True)
+    assert utility_dock.titleBarWidget() is title_bar
+    assert title_bar.property(functions._TITLE_BAR_COLLAPSED_PROPERTY) is None
+
+
+def test_style_collapsed_title_bar_restores_after_strategy_change(main_window_factory):
+    _use_strategy(TITLE_BAR_STRATEGY_STYLE)
+    window, main_window, docks = main_window_factory(2)
+    title_bar = docks[0].titleBarWidget()
+    before = _widget_state(title_bar)
+    update_docker_ui(main_window, True)
+
+    _use_strategy(TITLE_BAR_STRATEGY_PLACEHOLDER)
+    update_docker_ui(main_window, False)
+    assert docks[0].titleBarWidget() is title_bar
+    assert _widget_state(title_bar) == before